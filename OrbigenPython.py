@@ -1,11 +1,107 @@
 import plotly.graph_objects as go
-import urllib.request
+import numpy as np
 import urllib.parse
+import http.client
 import json
+import contextlib
+import functools
+import hashlib
+import io
+import os
+import queue
+import re
+import threading
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
-def get_planet_coords(target, center, start='1999-10-15', stop='2083-10-15', step='1d'):
+# numba compiles the vector parser to machine code, without it the regex parser is used
+try:
+    import numba
+except ImportError:
+    numba = None
+
+# zstandard shrinks the cached orbits on disk, without it they are stored raw
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# Horizons asks clients to keep to a handful of concurrent requests
+MAX_WORKERS = 5
+
+# Horizons ID of the Sun, every orbit is fetched around it
+SUN_ID = '10'
+
+API_HOST = "ssd.jpl.nasa.gov"
+API_PATH = "/api/horizons.api"
+
+# Idle keep-alive connections to Horizons, one per worker at most so every
+# request after the first skips the TCP and TLS handshake
+connection_pool = queue.LifoQueue(maxsize=MAX_WORKERS)
+
+# Parsed Horizons responses are kept here between runs
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "orbigen")
+
+# Horizons responses are read and scanned this many bytes at a time
+CHUNK_SIZE = 64 * 1024
+
+# Length of each Horizons step unit in days, checked in this order
+STEP_UNITS = [('mo', 30.436875), ('m', 1 / 1440), ('h', 1 / 24), ('d', 1), ('y', 365.25)]
+
+# Orbits are thinned out to about this many points before plotting, but
+# never below this many points per lap around the center
+MAX_ORBIT_POINTS = 2000
+MIN_POINTS_PER_ORBIT = 30
+
+# Matches the position line of a Horizons vector record, e.g.
+# " X =-1.7E-01 Y = 9.7E-01 Z =-3.6E-05"
+POS_RE = re.compile(rb'X\s*=\s*([-\d.E+]+)\s+Y\s*=\s*([-\d.E+]+)\s+Z\s*=\s*([-\d.E+]+)')
+
+def disk_cache(fetch):
+    """
+    Cache the coordinates returned by a Horizons query on disk
+
+    The file name is a SHA-256 of the query params, so any change to the
+    target, center, dates or step gets its own entry. Entries are .npy files,
+    zstd compressed when zstandard is installed.
+    """
+    @functools.wraps(fetch)
+    def wrapper(params):
+        key = hashlib.sha256(json.dumps(params, sort_keys=True).encode("utf-8")).hexdigest()
+        path = os.path.join(CACHE_DIR, f"{key}.npy")
+
+        if zstandard is not None and os.path.exists(f"{path}.zst"):
+            with open(f"{path}.zst", "rb") as f:
+                return np.load(io.BytesIO(zstandard.ZstdDecompressor().decompress(f.read())))
+        if os.path.exists(path):
+            return np.load(path)
+
+        coords = fetch(params)
+
+        # the .npy header keeps the shape and dtype, so compress the whole file
+        data = io.BytesIO()
+        np.save(data, coords)
+        data = data.getvalue()
+        if zstandard is not None:
+            data = zstandard.ZstdCompressor(level=3).compress(data)
+            path = f"{path}.zst"
+
+        # write to a temp file first so a half written entry is never loaded
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+        return coords
+    return wrapper
+
+@functools.lru_cache(maxsize=64)
+def get_planet_coords(target, center, start='1999-10-15', stop='2083-10-15', step='1d', decimate=True):
     """
     Fetch planetary coordinates from NASA Horizons API
+
+    Results are cached in memory for the run and on disk across runs.
     
     Args:
         target: Planet ID (e.g., '399' for Earth)
@@ -13,12 +109,11 @@ def get_planet_coords(target, center, start='1999-10-15', stop='2083-10-15', ste
         start: Start date (YYYY-MM-DD)
         stop: End date (YYYY-MM-DD)
         step: Time step (e.g., '30d' = 30 days)
+        decimate: Thin the orbit out for plotting, see decimate_orbit
     
     Returns:
-        List of [x, y, z] coordinates in AU
+        Read only (N, 3) float32 array of x, y, z coordinates in AU
     """
-    API_URL = "https://ssd.jpl.nasa.gov/api/horizons.api"
-    
     params = {
         "format": "json",
         "COMMAND": target,
@@ -28,29 +123,455 @@ def get_planet_coords(target, center, start='1999-10-15', stop='2083-10-15', ste
         "OUT_UNITS": "AU-D",
         "START_TIME": start,
         "STOP_TIME": stop,
-        "STEP_SIZE": step
+        "STEP_SIZE": step,
+        # one "JD, date, X, Y, Z," line per record instead of labelled blocks
+        "CSV_FORMAT": "YES",
+        "VEC_TABLE": "1"
     }
+    # plotly draws in float32 anyway, and it halves what gets written to the html
+    coords = query_horizons(params).astype(np.float32, copy=False)
+
+    if decimate:
+        coords = decimate_orbit(coords)
+
+    # the same array is handed to every caller, so don't let anyone edit it
+    coords.setflags(write=False)
+    return coords
+
+def decimate_orbit(coords):
+    """
+    Keep every nth point of an orbit so it's cheaper to plot
+
+    The stride aims for about MAX_ORBIT_POINTS points, but is capped so no
+    plotted step sweeps more than 1/MIN_POINTS_PER_ORBIT of a lap around the
+    center. Fast orbits like the Moon around Earth keep every point.
+
+    Args:
+        coords: (N, 3) array of x, y, z coordinates around the center
+
+    Returns:
+        Contiguous (M, 3) array of every nth point
+    """
+    stride = max(1, len(coords) // MAX_ORBIT_POINTS)
+
+    if stride > 1:
+        # angle swept around the center between neighbouring samples
+        points = coords.astype(np.float64)
+        norms = np.linalg.norm(points, axis=1)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            cos = np.einsum('ij,ij->i', points[:-1], points[1:]) / (norms[:-1] * norms[1:])
+        sweep = np.arccos(np.clip(cos[np.isfinite(cos)], -1, 1))
+
+        # the fastest part of the orbit decides the stride
+        max_sweep = np.max(sweep, initial=0.0)
+        if max_sweep > 0:
+            stride = min(stride, max(1, int(2 * np.pi / MIN_POINTS_PER_ORBIT / max_sweep)))
+
+    return np.ascontiguousarray(coords[::stride])
+
+def get_planet_coords_batch(targets, center, start='1999-10-15', stop='2083-10-15', step='1d', decimate=True):
+    """
+    Fetch the coordinates of several targets around one center
+
+    Horizons only takes one COMMAND per query, so the targets are fetched
+    concurrently rather than in a single request.
+
+    Args:
+        targets: List of planet IDs
+        center: Center point shared by every target
+        start: Start date (YYYY-MM-DD)
+        stop: End date (YYYY-MM-DD)
+        step: Time step (e.g., '30d' = 30 days)
+        decimate: Thin each orbit out for plotting, see get_planet_coords
+
+    Returns:
+        Dict of planet ID to its (N, 3) array of coordinates in AU
+    """
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        futures = {
+            executor.submit(get_planet_coords, target, center, start, stop, step, decimate): target
+            for target in targets
+        }
+        return {futures[future]: future.result() for future in as_completed(futures)}
+
+# Full resolution heliocentric orbit of every body fetched so far, by planet
+# ID. Orbits are only thinned out once they're in the frame being plotted,
+# the Moon around Earth needs far denser samples than around the Sun
+helio_cache = {}
+
+def load_heliocentric(planets_config):
+    """
+    Fetch the heliocentric orbit of every planet that isn't loaded yet
+
+    :param planets_config: List of dicts with 'id' and 'name' keys
+    """
+    targets = []
+    for planet in planets_config:
+        if planet['id'] not in helio_cache and planet['id'] != SUN_ID:
+            print(f"Fetching {planet['name']} relative to the Sun...")
+            targets.append(planet['id'])
+    for target, coords in get_planet_coords_batch(targets, SUN_ID, decimate=False).items():
+        # contiguous float32 so re-centering is one vectorized subtraction
+        helio_cache[target] = np.ascontiguousarray(coords, dtype=np.float32)
+
+def get_heliocentric(target):
+    """
+    Get a body's orbit around the Sun, fetching it only the first time
+
+    :param target: Planet ID
+    :return: (N, 3) array of x, y, z coordinates in AU, a single zero row for the Sun itself
+    """
+    coords = helio_cache.get(target)
+    if coords is None:
+        if target == SUN_ID:
+            # the Sun sits at the origin of its own frame, one row broadcasts against any orbit
+            coords = np.zeros((1, 3), dtype=np.float32)
+        else:
+            coords = np.ascontiguousarray(get_planet_coords(target, SUN_ID, decimate=False), dtype=np.float32)
+        helio_cache[target] = coords
+    return coords
+
+def get_relative(target, center):
+    """
+    Get a body's orbit around any center from the heliocentric orbits
+
+    The vector of P around C is (P around Sun) - (C around Sun), so each body
+    only ever needs one Horizons query no matter how many centers are used.
+
+    :param target: Planet ID
+    :param center: Planet ID of the center
+    :return: (N, 3) array of x, y, z coordinates in AU
+    """
+    if target == center:
+        return np.zeros((1, 3), dtype=np.float32)
+    return get_heliocentric(target) - get_heliocentric(center)
+
+@disk_cache
+def query_horizons(params):
+    """
+    Run a vector ephemeris query against the NASA Horizons API
+
+    Args:
+        params: Horizons query parameters
+
+    Returns:
+        (N, 3) array of x, y, z coordinates in AU
+    """
     # get data from nasa
     query = urllib.parse.urlencode(params)
-    url = f"{API_URL}?{query}"
-    
-    with urllib.request.urlopen(url) as response:
-        data = response.read().decode("utf-8")
-        result = json.loads(data)
-    
-    # Parse coordinates from the result
-    coords = []
-    data_section = result["result"].split("$$SOE")[1].split("$$EOE")[0]
-    lines = [line.strip() for line in data_section.strip().splitlines() if line.strip()]
-    
-    for i in range(0, len(lines), 4):
-        pos_line = lines[i+1]
-        x_str = pos_line.split("X =")[1].split("Y =")[0].strip()
-        y_str = pos_line.split("Y =")[1].split("Z =")[0].strip()
-        z_str = pos_line.split("Z =")[1].strip()
-        coords.append([float(x_str), float(y_str), float(z_str)])
-    
-    return coords
+
+    with horizons_request(query) as response:
+        return read_vectors(response, estimate_rows(params["START_TIME"], params["STOP_TIME"], params["STEP_SIZE"]))
+
+@contextlib.contextmanager
+def horizons_request(query):
+    """
+    Send a GET to the Horizons API over a pooled keep-alive connection
+
+    Args:
+        query: URL encoded query string
+
+    Yields:
+        The HTTP response, whatever is left unread is drained afterwards so
+        the connection can go back in the pool
+    """
+    try:
+        conn = connection_pool.get_nowait()
+    except queue.Empty:
+        conn = http.client.HTTPSConnection(API_HOST, timeout=60)
+
+    try:
+        try:
+            conn.request("GET", f"{API_PATH}?{query}")
+            response = conn.getresponse()
+        except (http.client.RemoteDisconnected, ConnectionError):
+            # the server dropped an idle connection, reconnect and try once more
+            conn.close()
+            conn.request("GET", f"{API_PATH}?{query}")
+            response = conn.getresponse()
+
+        yield response
+        response.read()
+    except BaseException:
+        conn.close()
+        raise
+
+    try:
+        connection_pool.put_nowait(conn)
+    except queue.Full:
+        conn.close()
+
+def estimate_rows(start, stop, step):
+    """
+    Work out how many records a Horizons query will return
+
+    Args:
+        start: Start date (YYYY-MM-DD)
+        stop: End date (YYYY-MM-DD)
+        step: Time step (e.g., '30d' = 30 days, or '100' for 100 equal intervals)
+
+    Returns:
+        Expected number of records, or a generic guess if the step can't be read
+    """
+    match = re.fullmatch(r'(\d+)\s*([a-z]*)', step.strip().lower())
+    if not match:
+        return 4096
+    count, unit = int(match[1]), match[2]
+
+    # a bare number asks for that many equal intervals
+    if not unit:
+        return count + 1
+
+    try:
+        days = (datetime.fromisoformat(stop) - datetime.fromisoformat(start)).total_seconds() / 86400
+    except ValueError:
+        return 4096
+
+    for prefix, unit_days in STEP_UNITS:
+        if unit.startswith(prefix):
+            return max(int(days / (count * unit_days)) + 1, 1)
+    return 4096
+
+def read_vectors(response, expected_rows=4096):
+    """
+    Parse position vectors out of a Horizons response while it downloads
+
+    The raw JSON is scanned chunk by chunk for complete lines between $$SOE
+    and $$EOE, so the full payload is never held in memory. Reading stops as
+    soon as $$EOE turns up.
+
+    Args:
+        response: File like HTTP response from the Horizons API
+        expected_rows: Number of records to allocate room for up front
+
+    Returns:
+        (N, 3) array of x, y, z coordinates in AU
+    """
+    buffer = bytearray()
+    scan_pos = None  # start of the unparsed data, None until $$SOE is seen
+    coords = np.empty((max(expected_rows, 1), 3), dtype=np.float64)
+    count = 0
+
+    while True:
+        chunk = response.read(CHUNK_SIZE)
+        buffer += chunk
+
+        if scan_pos is None:
+            # only look at the new bytes, plus enough overlap for a marker split across chunks
+            start = buffer.find(b"$$SOE", max(len(buffer) - len(chunk) - len(b"$$SOE") + 1, 0))
+            if start == -1:
+                if not chunk:
+                    break
+                continue
+            scan_pos = start + len(b"$$SOE")
+
+        # only parse up to the last complete line, newlines are still JSON escaped here
+        end = buffer.find(b"$$EOE", scan_pos)
+        stop = end if end != -1 else buffer.rfind(b"\\n", scan_pos)
+
+        if stop > scan_pos:
+            rows = parse_block(buffer, scan_pos, stop)
+            if count + len(rows) > len(coords):
+                grown = np.empty((max(2 * len(coords), count + len(rows)), 3), dtype=np.float64)
+                grown[:count] = coords[:count]
+                coords = grown
+            coords[count:count + len(rows)] = rows
+            count += len(rows)
+
+            # drop what has been parsed so the buffer stays about one chunk long
+            del buffer[:stop]
+            scan_pos = 0
+
+        if end != -1:
+            # copy if the estimate was off so the spare rows can be freed
+            return coords if count == len(coords) else coords[:count].copy()
+        if not chunk:
+            raise ValueError("Horizons response ended before $$EOE")
+
+    # no ephemeris at all, Horizons puts the reason in the JSON body
+    try:
+        result = json.loads(bytes(buffer))
+    except ValueError:
+        raise ValueError(f"Horizons returned HTTP {response.status} without an ephemeris") from None
+    raise ValueError(result.get("error") or result.get("result", "Horizons returned no ephemeris"))
+
+def parse_block(buffer, start, stop):
+    """
+    Parse the position vectors in buffer[start:stop]
+
+    Args:
+        buffer: Raw Horizons response bytes
+        start: Offset of the first byte to parse
+        stop: Offset just past the last byte to parse
+
+    Returns:
+        (N, 3) array of x, y, z coordinates in AU
+    """
+    # CSV lines always have commas, the labelled format we fall back to never does
+    csv = buffer.find(b",", start, stop) != -1
+
+    if numba is not None:
+        data = np.frombuffer(buffer, dtype=np.uint8, count=stop - start, offset=start)
+        return parse_csv_block_jit(data) if csv else parse_block_jit(data)
+
+    if csv:
+        lines = [line for line in buffer[start:stop].decode("ascii").split("\\n") if line.strip()]
+        if not lines:
+            return np.empty((0, 3), dtype=np.float64)
+        return np.loadtxt(lines, delimiter=",", usecols=(2, 3, 4), ndmin=2)
+
+    # numpy runs float() on every match in one C level loop instead of a Python loop
+    return np.asarray(POS_RE.findall(buffer, start, stop), dtype=np.float64).reshape(-1, 3)
+
+if numba is not None:
+    @numba.njit(cache=True)
+    def parse_float_jit(data, i):
+        """
+        Read a number like -1.234E-01 starting at data[i], skipping leading spaces
+
+        Returns (value, index after the number), index is -1 if there was no number.
+        """
+        n = len(data)
+        while i < n and data[i] == 32:
+            i += 1
+
+        negative = False
+        if i < n and (data[i] == 45 or data[i] == 43):  # - or +
+            negative = data[i] == 45
+            i += 1
+
+        # keep up to 18 digits exactly in an int, more than a double can hold anyway
+        mantissa = 0
+        exponent = 0
+        digits = 0
+        while i < n and 48 <= data[i] <= 57:
+            if digits < 18:
+                mantissa = mantissa * 10 + (data[i] - 48)
+            else:
+                exponent += 1
+            digits += 1
+            i += 1
+        if i < n and data[i] == 46:  # .
+            i += 1
+            while i < n and 48 <= data[i] <= 57:
+                if digits < 18:
+                    mantissa = mantissa * 10 + (data[i] - 48)
+                    exponent -= 1
+                digits += 1
+                i += 1
+        if digits == 0:
+            return 0.0, -1
+
+        if i < n and (data[i] == 69 or data[i] == 101):  # E or e
+            i += 1
+            exp_negative = False
+            if i < n and (data[i] == 45 or data[i] == 43):
+                exp_negative = data[i] == 45
+                i += 1
+            exp_value = 0
+            while i < n and 48 <= data[i] <= 57:
+                exp_value = exp_value * 10 + (data[i] - 48)
+                i += 1
+            exponent += -exp_value if exp_negative else exp_value
+
+        # dividing by an exact power of ten rounds better than multiplying by 10**-k
+        if -22 <= exponent < 0:
+            value = mantissa / 10.0 ** -exponent
+        else:
+            value = mantissa * 10.0 ** exponent
+        return (-value if negative else value), i
+
+    @numba.njit(cache=True)
+    def parse_label_jit(data, i, label):
+        """
+        Match a label like 'Y =' at data[i], returns the index after '=' or -1
+        """
+        n = len(data)
+        while i < n and data[i] == 32:
+            i += 1
+        if i >= n or data[i] != label:
+            return -1
+        i += 1
+        while i < n and data[i] == 32:
+            i += 1
+        if i >= n or data[i] != 61:  # =
+            return -1
+        return i + 1
+
+    @numba.njit(cache=True)
+    def parse_block_jit(data):
+        """
+        Scan raw response bytes for 'X = .. Y = .. Z = ..' position lines
+        """
+        n = len(data)
+        # a position line is always more than 14 bytes long
+        coords = np.empty((n // 14 + 1, 3), dtype=np.float64)
+        count = 0
+        i = 0
+        while i < n:
+            # X at the start of a word, so the VX of the velocity line is skipped
+            if data[i] == 88 and (i == 0 or not (65 <= data[i - 1] <= 90 or 97 <= data[i - 1] <= 122)):
+                j = parse_label_jit(data, i, 88)
+                if j != -1:
+                    x, j = parse_float_jit(data, j)
+                if j != -1:
+                    j = parse_label_jit(data, j, 89)
+                if j != -1:
+                    y, j = parse_float_jit(data, j)
+                if j != -1:
+                    j = parse_label_jit(data, j, 90)
+                if j != -1:
+                    z, j = parse_float_jit(data, j)
+                if j != -1:
+                    coords[count, 0] = x
+                    coords[count, 1] = y
+                    coords[count, 2] = z
+                    count += 1
+                    i = j
+                    continue
+            i += 1
+        return coords[:count]
+
+    @numba.njit(cache=True)
+    def parse_csv_block_jit(data):
+        """
+        Pull the X, Y, Z columns out of 'JD, date, X, Y, Z, ...' CSV lines
+        """
+        n = len(data)
+        # a CSV record is always more than 20 bytes long
+        coords = np.empty((n // 20 + 1, 3), dtype=np.float64)
+        count = 0
+        i = 0
+        while i < n:
+            # lines end in a JSON escaped \n, so stop at the backslash
+            end = i
+            while end < n and data[end] != 92:
+                end += 1
+            line = data[i:end]
+
+            # skip the JD and calendar date columns
+            j = 0
+            commas = 0
+            while j < len(line) and commas < 2:
+                if line[j] == 44:  # ,
+                    commas += 1
+                j += 1
+
+            if commas == 2:
+                for k in range(3):
+                    value, j = parse_float_jit(line, j)
+                    if j == -1:
+                        break
+                    coords[count, k] = value
+                    while j < len(line) and line[j] == 32:
+                        j += 1
+                    if j < len(line) and line[j] == 44:
+                        j += 1
+                if j != -1:
+                    count += 1
+
+            i = end + 2
+        return coords[:count]
 
 # Define planets to visualize
 planets = [
@@ -64,6 +585,94 @@ planets = [
     {'id': '699', 'name': 'Saturn', "color": 'black'}
 ]
 
+# Layout shared by every figure, the title is filled in per figure
+LAYOUT_TEMPLATE = dict(
+    annotations=[
+        dict(
+            text="Plotted over 83 years<br><sub>Data from NASA Jet Propulsion Laboratory",
+            xref="paper", yref="paper",
+            x=0.2, y=1.1,
+            showarrow=False,
+            xanchor='center',
+            font=dict(size=12, color="gray")
+        )
+    ],
+    scene=dict(
+        xaxis_title='X (AU)',
+        yaxis_title='Y (AU)',
+        zaxis_title='Z (AU)',
+        aspectmode='data',
+        camera=dict(
+            eye=dict(x=0, y=0, z=2),
+            center=dict(x=0, y=0, z=0),
+            up=dict(x=0, y=1, z=0)
+        )
+    ),
+    showlegend=True,
+    margin=dict(l=100, r=100, t=150, b=0)
+)
+
+def make_title(text):
+    """
+    Build the figure title, placed over the left of the plot
+
+    :param text: title text
+    """
+    return {
+        'text': text,
+        'x': 0.25,
+        'xanchor': 'center'
+    }
+
+def make_orbit_trace(planet, coords, width=1):
+    """
+    Build the line trace for one planet's orbit, thinned out for its frame
+
+    :param planet: dict with 'name' and 'color' keys
+    :param coords: (N, 3) array of x, y, z coordinates in AU around the center
+    :param width: line width
+    """
+    x, y, z = decimate_orbit(coords).T
+    return go.Scatter3d(
+        x=x, y=y, z=z,
+        mode='lines',
+        line=dict(color=planet['color'], width=width),
+        name=planet['name']
+    )
+
+def make_center_trace(planet, size=1):
+    """
+    Build the marker for the planet everything is plotted around
+
+    :param planet: dict with 'name' and 'color' keys
+    :param size: marker size
+    """
+    # center planet is in the center, no need for pulling coordinates
+    return go.Scatter3d(
+        x=[0], y=[0], z=[0],
+        mode='markers',
+        marker=dict(color=planet['color'], size=size),
+        name=planet['name']
+    )
+
+def recentre(frame_name, planets_config=planets):
+    """
+    Move every planet's orbit to another center without going back to Horizons
+
+    Only the first call has to fetch anything, after that re-centering is a
+    subtraction per planet.
+
+    :param frame_name: name of the planet to use as the center, e.g. 'Earth'
+    :param planets_config: List of dicts with 'id' and 'name' keys
+    :return: dict of planet name to its full resolution (N, 3) array of coordinates in AU
+    """
+    center = next((planet for planet in planets_config if planet['name'] == frame_name), None)
+    if center is None:
+        raise ValueError(f"No planet named {frame_name!r}")
+
+    load_heliocentric(planets_config)
+    return {planet['name']: get_relative(planet['id'], center['id']) for planet in planets_config}
+
 def visualize_orbits(planets_config, center_index, title="Geocentric Solar System"):
     """
     Create interactive 3D visualization of planetary orbits from a geocentric perspective
@@ -72,68 +681,21 @@ def visualize_orbits(planets_config, center_index, title="Geocentric Solar Syste
     :param center_index: the index of the list of planets that will be used as the reference point for the orbit gen
     :param title: Geocentric Solar System
     """
-    fig = go.Figure()
-
     #gets info on the center planet, easier to read :^)
-    center_planet_id = planets_config[center_index]['id']
     center_name = planets_config[center_index]['name']
-    center_color = planets_config[center_index]['color']
 
-    # Fetch and plot each planet's orbit
+    # Every orbit is fetched around the Sun once and moved to the center locally
+    coords_by_name = recentre(center_name, planets_config)
+
+    # Plot in config order so the legend stays stable
+    traces = []
     for i, planet in enumerate(planets_config):
         if i != center_index:
-            print(f"Fetching {planet['name']} relative to {center_name}...")
-            coords = get_planet_coords(planet['id'], center_planet_id)
-            x, y, z = zip(*coords)
-
-            fig.add_trace(go.Scatter3d(
-                x=x, y=y, z=z,
-                mode='lines',
-                line=dict(color=planet['color'], width=1),
-                name=planet['name']
-            ))
+            traces.append(make_orbit_trace(planet, coords_by_name[planet['name']], width=1))
         else:
-            # center planet is in the center, no need for pulling coordinates
-            fig.add_trace(go.Scatter3d(
-                x=[0], y=[0], z=[0],
-                mode='markers',
-                marker=dict(color=center_color, size=1),
-                name=center_name
-            ))
-
-    # Update layout
-    fig.update_layout(
-        title={
-            'text': title,
-            'x': 0.25,
-            'xanchor': 'center'
-    }   ,
-        annotations=[
-            dict(
-                text="Plotted over 83 years<br><sub>Data from NASA Jet Propulsion Labratory",
-                xref="paper", yref="paper",
-                x=0.2, y=1.1,
-                showarrow=False,
-                xanchor='center',
-                font=dict(size=12, color="gray")
-            )
-        ],
-        scene=dict(
-            xaxis_title='X (AU)',
-            yaxis_title='Y (AU)',
-            zaxis_title='Z (AU)',
-            aspectmode='data',
-            camera=dict(
-                eye=dict(x=0, y=0, z=2),
-                center=dict(x=0, y=0, z=0),
-                up=dict(x=0, y=1, z=0)
-            )
-        ),
-        showlegend=True,
-        margin=dict(l=100, r=100, t=150, b=0)
-        )
-    
-    return fig
+            traces.append(make_center_trace(planet, size=1))
+
+    return go.Figure(data=traces, layout=dict(LAYOUT_TEMPLATE, title=make_title(title)))
 
 # visual for multiple center points (WIP)
 def create_multi_center_visualization(planets_config, center_indices=[0, 4]):
@@ -144,49 +706,30 @@ def create_multi_center_visualization(planets_config, center_indices=[0, 4]):
         planets_config: List of planet dictionaries
         center_indices: List of indices to create views for (e.g., [0, 4] for Sun and Earth)
     """
-    fig = go.Figure()
-
+    # Every orbit is fetched around the Sun once, each view is worked out locally
     coords_by_center = {}
     for center_idx in center_indices:
-        center_id = planets_config[center_idx]["id"]
-        coords_by_center
+        center_name = planets_config[center_idx]['name']
 
-    # Traces for perspective selector
+        print(f"\nGenerating {center_name}-centric view...")
+        coords_by_center[center_name] = recentre(center_name, planets_config)
+
+    # Traces for perspective selector, collected in a plain list so the
+    # figure is built once instead of revalidated on every add_trace
+    all_traces = []
     trace_groups = []
     
-    for view_idx, center_idx in enumerate(center_indices):
-        center_planet_id = planets_config[center_idx]['id']
+    for center_idx in center_indices:
         center_name = planets_config[center_idx]['name']
-        center_color = planets_config[center_idx]['color']
-
         group_traces = []
 
-        print(f"/nGenerating {center_name}-centric view...")
-
         for i, planet in enumerate(planets_config):
             if i != center_idx:
-                print(f"    Fetching {planet['name']} relative to {center_name}...")
-                coords = get_planet_coords(planet['id'], center_planet_id)
-                x, y, z = zip(*coords)
-                trace = go.Scatter3d(
-                    x=x, y=y, z=z,
-                    mode='lines',
-                    line=dict(color=planet['color'], width=3),
-                    name=planet['name'],
-                    visible=True
-                )
-                fig.add_trace(trace)
-                group_traces.append(len(fig.data) - 1)
+                trace = make_orbit_trace(planet, coords_by_center[center_name][planet['name']], width=3)
             else:
-                trace = go.Scatter3d(
-                    x=[0], y=[0], z=[0],
-                    mode='markers',
-                    marker=dict(color=center_color, size=10),
-                    name=center_name,
-                    visible=True
-                )
-                fig.add_trace(trace)
-                group_traces.append(len(fig.data) - 1)
+                trace = make_center_trace(planet, size=10)
+            all_traces.append(trace)
+            group_traces.append(len(all_traces) - 1)
         
         trace_groups.append(group_traces)
     
@@ -195,7 +738,7 @@ def create_multi_center_visualization(planets_config, center_indices=[0, 4]):
     for view_idx, center_idx in enumerate(center_indices):
         
         # Create visibility list: all False, then True for this view's traces
-        visible = [False] * len(fig.data)
+        visible = [False] * len(all_traces)
         for trace_idx in trace_groups[view_idx]:
             visible[trace_idx] = True
 
@@ -209,33 +752,9 @@ def create_multi_center_visualization(planets_config, center_indices=[0, 4]):
         )
         buttons.append(button)
     
-    fig.update_layout(
-        title={
-            'text': f"{planets_config[center_indices[0]]['name']}-centric Solar System",
-            'x': 0.25,
-            'xanchor': 'center'
-        },
-        annotations=[
-            dict(
-                text="Plotted over 83 years<br><sub>Data from NASA Jet Propulsion Laboratory",
-                xref="paper", yref="paper",
-                x=0.2, y=1.1,
-                showarrow=False,
-                xanchor='center',
-                font=dict(size=12, color="gray")
-            )
-        ],
-        scene=dict(
-            xaxis_title='X (AU)',
-            yaxis_title='Y (AU)',
-            zaxis_title='Z (AU)',
-            aspectmode='data',
-            camera=dict(
-                eye=dict(x=0, y=0, z=2),
-                center=dict(x=0, y=0, z=0),
-                up=dict(x=0, y=1, z=0)
-            )
-        ),
+    layout = dict(
+        LAYOUT_TEMPLATE,
+        title=make_title(f"{planets_config[center_indices[0]]['name']}-centric Solar System"),
         updatemenus=[
             dict(
                 type="buttons",
@@ -248,22 +767,22 @@ def create_multi_center_visualization(planets_config, center_indices=[0, 4]):
                 y=1.15,
                 yanchor="top"
             )
-        ],
-        showlegend=True,
-        margin=dict(l=100, r=100, t=150, b=0)
+        ]
     )
     
-    return fig
+    return go.Figure(data=all_traces, layout=layout)
 
 
-# Create visualization
-print("Creating orbital visualization...")
-fig = visualize_orbits(planets, 4)
+if __name__ == "__main__":
+    # Create visualization
+    print("Creating orbital visualization...")
+    fig = visualize_orbits(planets, 4)
 
-# Show interactive plot
-fig.show()
+    # Show interactive plot
+    fig.show()
 
-# Save to HTML file
-output_file = "Orbigen.html"
-fig.write_html(output_file)
-print(f"\nVisualization saved to {output_file}")
\ No newline at end of file
+    # Save to HTML file, plotly.js comes from the CDN instead of being inlined
+    # and the traces were already validated when the figure was built
+    output_file = "Orbigen.html"
+    fig.write_html(output_file, include_plotlyjs='cdn', validate=False)
+    print(f"\nVisualization saved to {output_file}")
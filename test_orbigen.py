@@ -0,0 +1,145 @@
+import io
+import json
+import random
+
+import numpy as np
+import pytest
+
+import OrbigenPython as orbigen
+
+
+def make_values(count, seed=1999):
+    """
+    Random coordinates spread over the magnitudes Horizons returns, as the
+    strings it would print them as
+    """
+    rng = random.Random(seed)
+    return [f"{rng.uniform(-50, 50) * 10 ** rng.randint(-9, 2): .15E}" for _ in range(count * 3)]
+
+def make_payload(values, csv):
+    """
+    Build a raw Horizons JSON response holding the given coordinates
+    """
+    lines = []
+    for k in range(0, len(values), 3):
+        x, y, z = values[k:k + 3]
+        jd = 2451466.5 + k // 3
+        if csv:
+            lines.append(f"{jd:.9f}, A.D. 1999-Oct-15 00:00:00.0000, {x}, {y}, {z},")
+        else:
+            lines.append(f"{jd:.9f} = A.D. 1999-Oct-15 00:00:00.0000 TDB ")
+            lines.append(f" X ={x} Y ={y} Z ={z}")
+            lines.append(" VX= 1.000000000000000E-02 VY=-2.000000000000000E-02 VZ= 3.000000000000000E-04")
+            lines.append(" LT= 5.775518331436995E-03 RG= 1.000000000000000E+00 RR=-1.000000000000000E-04")
+    result = "Ephemeris header\n*****\n$$SOE\n" + "\n".join(lines) + "\n$$EOE\n*****\nfooter\n"
+    return json.dumps({"signature": {"version": "1.2"}, "result": result}).encode("utf-8")
+
+@pytest.fixture(params=["numba", "regex"])
+def parser(request, monkeypatch):
+    if request.param == "numba":
+        if orbigen.numba is None:
+            pytest.skip("numba is not installed")
+    else:
+        monkeypatch.setattr(orbigen, "numba", None)
+    return request.param
+
+# every small chunk size from 5 up splits the $$SOE/$$EOE markers and the
+# escaped newlines at some point
+@pytest.mark.parametrize("chunk_size", [*range(5, 13), 64, 64 * 1024])
+@pytest.mark.parametrize("csv", [False, True], ids=["labelled", "csv"])
+def test_read_vectors_matches_float(parser, csv, chunk_size, monkeypatch):
+    monkeypatch.setattr(orbigen, "CHUNK_SIZE", chunk_size)
+    values = make_values(300)
+
+    coords = orbigen.read_vectors(io.BytesIO(make_payload(values, csv)), expected_rows=100)
+
+    expected = np.array([float(v) for v in values]).reshape(-1, 3)
+    assert coords.shape == expected.shape
+    if parser == "numba":
+        # the hand rolled parser can be off from float() by an ulp or two
+        np.testing.assert_allclose(coords, expected, rtol=1e-15, atol=0)
+    else:
+        np.testing.assert_array_equal(coords, expected)
+
+@pytest.mark.parametrize("csv", [False, True], ids=["labelled", "csv"])
+def test_read_vectors_empty_ephemeris(parser, csv):
+    coords = orbigen.read_vectors(io.BytesIO(make_payload([], csv)))
+    assert coords.shape == (0, 3)
+
+def test_read_vectors_reports_horizons_error(parser):
+    payload = json.dumps({"error": "Cannot interpret date"}).encode("utf-8")
+    with pytest.raises(ValueError, match="Cannot interpret date"):
+        orbigen.read_vectors(io.BytesIO(payload))
+
+def test_read_vectors_truncated(parser, monkeypatch):
+    monkeypatch.setattr(orbigen, "CHUNK_SIZE", 64)
+    payload = make_payload(make_values(50), csv=True)
+    with pytest.raises(ValueError, match="EOE"):
+        orbigen.read_vectors(io.BytesIO(payload[:len(payload) // 2]))
+
+def circular_orbit(radius, period, days=30682):
+    """
+    Daily samples of a circular orbit in the x-y plane
+    """
+    t = 2 * np.pi * np.arange(days) / period
+    return np.column_stack([radius * np.cos(t), radius * np.sin(t), np.zeros(days)]).astype(np.float32)
+
+def max_step_angle(coords):
+    """
+    Largest angle in degrees swept around the origin between plotted points
+    """
+    points = coords.astype(np.float64)
+    cos = np.einsum('ij,ij->i', points[:-1], points[1:])
+    cos /= np.linalg.norm(points[:-1], axis=1) * np.linalg.norm(points[1:], axis=1)
+    return np.degrees(np.arccos(np.clip(cos, -1, 1))).max()
+
+@pytest.mark.parametrize("period", [27.3, 88.0, 365.25, 10759.0], ids=["moon", "mercury", "earth", "saturn"])
+def test_decimate_orbit_keeps_orbits_round(period):
+    raw = circular_orbit(1.0, period)
+    coords = orbigen.decimate_orbit(raw)
+
+    # the Moon already moves more than 1/30 of a lap a day, so it keeps every point
+    assert max_step_angle(coords) <= max(360 / orbigen.MIN_POINTS_PER_ORBIT, max_step_angle(raw)) + 1e-6
+    assert coords.flags.c_contiguous
+
+def test_decimate_orbit_thins_slow_orbits():
+    coords = orbigen.decimate_orbit(circular_orbit(9.5, 10759.0))
+    assert len(coords) <= 2 * orbigen.MAX_ORBIT_POINTS
+
+def test_decimate_orbit_single_point():
+    coords = orbigen.decimate_orbit(np.zeros((1, 3), dtype=np.float32))
+    assert coords.shape == (1, 3)
+
+@pytest.fixture
+def fake_horizons(monkeypatch):
+    """
+    Serve daily heliocentric Earth and Moon orbits instead of querying Horizons
+    """
+    earth = circular_orbit(1.0, 365.25).astype(np.float64)
+    orbits = {'399': earth, '301': earth + circular_orbit(0.00257, 27.3)}
+
+    def query_horizons(params):
+        assert params["CENTER"] == orbigen.SUN_ID
+        return orbits[params["COMMAND"]]
+
+    monkeypatch.setattr(orbigen, "query_horizons", query_horizons)
+    monkeypatch.setattr(orbigen, "helio_cache", {})
+    orbigen.get_planet_coords.cache_clear()
+    yield
+    orbigen.get_planet_coords.cache_clear()
+
+def test_geocentric_moon_is_sampled_for_its_frame(fake_horizons):
+    planets_config = [
+        {'id': '10', 'name': 'Sun', 'color': 'yellow'},
+        {'id': '399', 'name': 'Earth', 'color': 'blue'},
+        {'id': '301', 'name': 'Moon', 'color': 'purple'},
+    ]
+
+    fig = orbigen.visualize_orbits(planets_config, 1)
+
+    moon = next(trace for trace in fig.data if trace.name == 'Moon')
+    assert max_step_angle(np.column_stack([moon.x, moon.y, moon.z])) < 15
+
+    # the slow Sun around Earth still gets thinned out
+    sun = next(trace for trace in fig.data if trace.name == 'Sun')
+    assert len(sun.x) < 5000